@@ -17,14 +17,26 @@
 
 import bmesh
 import collections
+import hashlib
+import importlib
+import itertools
+import logging
 import math
 import mathutils
 import sys
-import threading
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, Generator, Iterable, List, Optional, Set, Tuple
 from . import linalg
 from . import types
 
+INDEX_BATCH_SIZE = 4096
+RELAX_BATCH_SIZE = 32
+RELAX_MAX_ITERATIONS = 100000
+RELAX_TOLERANCE = 1e-8
+WEIGHT_CACHE_SIZE = 4
+
+# Weights of recently faired regions, from least to most recently used.
+_weight_cache = collections.OrderedDict()
+
 
 def calc_circumcenter(a: mathutils.Vector,
                       b: mathutils.Vector,
@@ -158,6 +170,300 @@ def calc_mvc_loop_weight(l: bmesh.types.BMLoop) -> float:
     return weight
 
 
+def get_coords(verts: Iterable[bmesh.types.BMVert], count: int):
+    """
+    Gathers coordinates of given vertices into a contiguous array
+
+    Parameters:
+        verts (Iterable[bmesh.types.BMVert]): Vertices to evaluate
+        count (int):                          Number of vertices
+
+    Returns:
+        numpy.ndarray: Coordinates of shape (count, 3)
+    """
+    numpy = importlib.import_module('numpy')
+    return numpy.fromiter(
+        itertools.chain.from_iterable(v.co for v in verts),
+        numpy.float64, 3 * count).reshape(-1, 3)
+
+
+def set_coords(verts: Iterable[bmesh.types.BMVert], co):
+    """
+    Scatters coordinates from a contiguous array to given vertices
+
+    Parameters:
+        verts (Iterable[bmesh.types.BMVert]): Vertices to act upon
+        co (numpy.ndarray):                   Coordinates of shape (n, 3)
+    """
+    for v, v_co in zip(verts, co.tolist()):
+        v.co = v_co
+
+
+def update_normals(verts: Iterable[bmesh.types.BMVert],
+                   faces: Iterable[bmesh.types.BMFace] = ()):
+    """
+    Recalculates normals affected by displacing given vertices, rather than
+    those of the entire mesh
+
+    Parameters:
+        verts (Iterable[bmesh.types.BMVert]): Displaced vertices
+        faces (Iterable[bmesh.types.BMFace]): Additional faces whose normals
+                                              are out of date
+    """
+    dirty_faces = {f for v in verts for f in v.link_faces}
+    dirty_faces.update(f for f in faces if f.is_valid)
+    for f in dirty_faces:
+        f.normal_update()
+
+    # Vertex normals blend the normals of every linked face.
+    for v in {v for f in dirty_faces for v in f.verts}:
+        v.normal_update()
+
+
+def calc_weights(vert_weight: types.VertexWeight,
+                 loop_weight: types.LoopWeight,
+                 co, a, b, c, d, valence) -> Tuple:
+    """
+    Calculates vertex and loop weights in a single vectorized pass, using a
+    specialized calculation for common combinations of weight types
+
+    Each loop is described by the index of its vertex (a), the vertices of
+    the next and previous loops (b, c), and the vertex opposite its edge in
+    the radially adjacent face (d), which is -1 for boundary edges.
+
+    Parameters:
+        vert_weight (types.VertexWeight): Vertex weight type
+        loop_weight (types.LoopWeight):   Loop weight type
+        co (numpy.ndarray):               Vertex coordinates of shape (n, 3)
+        a, b, c, d (numpy.ndarray):       Vertex indices describing each loop
+        valence (numpy.ndarray):          Number of edges linked to each
+                                          vertex whose loops are given
+
+    Returns:
+        Tuple[numpy.ndarray]: Weight of each vertex whose loops are given,
+                              followed by the weight of each loop
+    """
+    calc = _weight_calcs.get((vert_weight, loop_weight))
+    if calc is None:
+        return calc_any_weights(
+            vert_weight, loop_weight, co, a, b, c, d, valence)
+    return calc(co, a, b, c, d, valence)
+
+
+def calc_uniform_weights(co, a, b, c, d, valence) -> Tuple:
+    """
+    Calculates uniform vertex and loop weights, which depend on topology alone
+
+    Parameters:
+        co (numpy.ndarray):         Vertex coordinates of shape (n, 3)
+        a, b, c, d (numpy.ndarray): Vertex indices describing each loop
+        valence (numpy.ndarray):    Number of edges linked to each vertex
+                                    whose loops are given
+
+    Returns:
+        Tuple[numpy.ndarray]: Weight of each vertex whose loops are given,
+                              followed by the weight of each loop
+    """
+    numpy = importlib.import_module('numpy')
+    vert_weights = numpy.divide(
+        1, valence, out = numpy.full(len(valence), float(sys.maxsize)),
+        where = valence != 0)
+    return vert_weights, numpy.ones(len(a))
+
+
+def calc_voronoi_cotan_weights(co, a, b, c, d, valence) -> Tuple:
+    """
+    Calculates Voronoi vertex weights and cotangent loop weights together
+
+    The Voronoi area of each loop triangle is expressed with the cotangents
+    of its angles, which the loop weights share, rather than by locating its
+    circumcenter.
+
+    Parameters:
+        co (numpy.ndarray):         Vertex coordinates of shape (n, 3)
+        a, b, c, d (numpy.ndarray): Vertex indices describing each loop
+        valence (numpy.ndarray):    Number of edges linked to each vertex
+                                    whose loops are given
+
+    Returns:
+        Tuple[numpy.ndarray]: Weight of each vertex whose loops are given,
+                              followed by the weight of each loop
+    """
+    numpy = importlib.import_module('numpy')
+    count = len(valence)
+
+    # Compute the cross product and cotangents of each loop triangle once.
+    co_a = co[a]
+    co_b = co[b]
+    ab = co_b - co_a
+    ac = co[c] - co_a
+    bc = ac - ab
+    ab_cross_ac_len = numpy.linalg.norm(numpy.cross(ab, ac), axis = 1)
+    cot_b = calc_cotangents(-ab, bc, ab_cross_ac_len)
+    cot_c = calc_cotangents(ac, bc, ab_cross_ac_len)
+
+    # Sum areas of the triangles between edge midpoints and circumcenter, or
+    # take half the area of the loop triangle if its angle is not acute.
+    is_acute = numpy.einsum('ij,ij->i', ab, ac) > 0
+    area = numpy.where(
+        is_acute,
+        (numpy.einsum('ij,ij->i', ab, ab) * numpy.abs(cot_c) +
+         numpy.einsum('ij,ij->i', ac, ac) * numpy.abs(cot_b)) / 8,
+        ab_cross_ac_len / 4)
+    area[ab_cross_ac_len == 0] = 0
+    area = numpy.bincount(a, area, count)
+    vert_weights = numpy.divide(1, area, out = numpy.full(count, 1e12),
+                                where = area != 0)
+
+    # Sum cotangents of the angles opposite each loop's edge.
+    has_d = d >= 0
+    co_d = co[d[has_d]]
+    da = co_a[has_d] - co_d
+    db = co_b[has_d] - co_d
+    loop_weights = cot_c
+    loop_weights[has_d] += calc_cotangents(
+        da, db, numpy.linalg.norm(numpy.cross(da, db), axis = 1))
+    loop_weights /= 2
+    return vert_weights, loop_weights
+
+
+def calc_any_weights(vert_weight: types.VertexWeight,
+                     loop_weight: types.LoopWeight,
+                     co, a, b, c, d, valence) -> Tuple:
+    """
+    Calculates vertex and loop weights of any type in a single vectorized
+    pass
+
+    The cross product of each loop triangle is computed once and shared by
+    the area and angle calculations.
+
+    Parameters:
+        vert_weight (types.VertexWeight): Vertex weight type
+        loop_weight (types.LoopWeight):   Loop weight type
+        co (numpy.ndarray):               Vertex coordinates of shape (n, 3)
+        a, b, c, d (numpy.ndarray):       Vertex indices describing each loop
+        valence (numpy.ndarray):          Number of edges linked to each
+                                          vertex whose loops are given
+
+    Returns:
+        Tuple[numpy.ndarray]: Weight of each vertex whose loops are given,
+                              followed by the weight of each loop
+    """
+    numpy = importlib.import_module('numpy')
+    count = len(valence)
+
+    # Compute the cross product of each loop triangle once.
+    co_a = co[a]
+    co_b = co[b]
+    co_c = co[c]
+    ab = co_b - co_a
+    ac = co_c - co_a
+    ab_cross_ac = numpy.cross(ab, ac)
+    ab_cross_ac_len = numpy.linalg.norm(ab_cross_ac, axis = 1)
+    has_d = d >= 0
+    co_d = co[d[has_d]]
+
+    # Calculate vertex weights.
+    if vert_weight is types.VertexWeight.UNIFORM:
+        vert_weights = numpy.divide(
+            1, valence, out = numpy.full(count, float(sys.maxsize)),
+            where = valence != 0)
+    else:
+        if vert_weight is types.VertexWeight.BARYCENTRIC:
+            area = ab_cross_ac_len / 6
+        else:
+
+            # Locate the circumcenter, or the midpoint of the opposite edge if
+            # the angle of the loop is not acute.
+            is_acute = numpy.einsum('ij,ij->i', ab, ac) > 0
+            is_degenerate = ab_cross_ac_len == 0
+            denom = numpy.where(is_degenerate, 1, 2 * ab_cross_ac_len ** 2)
+            offset = numpy.einsum('ij,ij->i', ac, ac)[:, None] * numpy.cross(ab_cross_ac, ab)
+            offset += numpy.einsum('ij,ij->i', ab, ab)[:, None] * numpy.cross(ac, ab_cross_ac)
+            offset[is_degenerate] = 0
+            ad = numpy.where(is_acute[:, None], offset / denom[:, None],
+                             (ab + ac) / 2)
+
+            # Sum areas of the triangles between edge midpoints and center.
+            area = numpy.linalg.norm(numpy.cross(ab / 2, ad), axis = 1) / 2
+            area += numpy.linalg.norm(numpy.cross(ad, ac / 2), axis = 1) / 2
+
+        area = numpy.bincount(a, area, count)
+        vert_weights = numpy.divide(1, area, out = numpy.full(count, 1e12),
+                                    where = area != 0)
+
+    # Calculate loop weights.
+    if loop_weight is types.LoopWeight.UNIFORM:
+        loop_weights = numpy.ones(len(a))
+    elif loop_weight is types.LoopWeight.COTAN:
+
+        # Sum cotangents of the angles opposite each loop's edge.
+        loop_weights = calc_cotangents(co_a - co_c, co_b - co_c, ab_cross_ac_len)
+        da = co_a[has_d] - co_d
+        db = co_b[has_d] - co_d
+        loop_weights[has_d] += calc_cotangents(
+            da, db, numpy.linalg.norm(numpy.cross(da, db), axis = 1))
+        loop_weights /= 2
+    else:
+
+        # Sum tangents of half the angles adjacent to each loop's edge.
+        loop_weights = calc_half_tangents(ab, ac, ab_cross_ac_len)
+        ad = co_d - co_a[has_d]
+        loop_weights[has_d] += calc_half_tangents(
+            ab[has_d], ad, numpy.linalg.norm(numpy.cross(ab[has_d], ad), axis = 1))
+        length = numpy.linalg.norm(ab, axis = 1)
+        loop_weights = numpy.divide(
+            loop_weights, length, out = numpy.zeros_like(length),
+            where = length > 0)
+
+    return vert_weights, loop_weights
+
+
+# Specialized weight calculations by vertex and loop weight types.
+_weight_calcs = {
+    (types.VertexWeight.UNIFORM, types.LoopWeight.UNIFORM): calc_uniform_weights,
+    (types.VertexWeight.VORONOI, types.LoopWeight.COTAN): calc_voronoi_cotan_weights,
+}
+
+
+def calc_cotangents(u, v, u_cross_v_len):
+    """
+    Calculates cotangents of the angles between pairs of vectors, substituting
+    a small positive value for degenerate angles
+
+    Parameters:
+        u, v (numpy.ndarray):          Vectors of shape (n, 3)
+        u_cross_v_len (numpy.ndarray): Magnitudes of u x v
+
+    Returns:
+        numpy.ndarray: Cotangents
+    """
+    numpy = importlib.import_module('numpy')
+    dot = numpy.einsum('ij,ij->i', u, v)
+    return numpy.divide(dot, u_cross_v_len,
+                        out = numpy.full_like(dot, 1e-4),
+                        where = u_cross_v_len != 0)
+
+
+def calc_half_tangents(u, v, u_cross_v_len):
+    """
+    Calculates tangents of half the angles between pairs of vectors
+
+    Parameters:
+        u, v (numpy.ndarray):          Vectors of shape (n, 3)
+        u_cross_v_len (numpy.ndarray): Magnitudes of u x v
+
+    Returns:
+        numpy.ndarray: Tangents of half angles
+    """
+    numpy = importlib.import_module('numpy')
+    denom = numpy.linalg.norm(u, axis = 1) * numpy.linalg.norm(v, axis = 1)
+    denom += numpy.einsum('ij,ij->i', u, v)
+    return numpy.divide(u_cross_v_len, denom,
+                        out = numpy.zeros_like(denom),
+                        where = denom != 0)
+
+
 def calc_mean_curvature(v: bmesh.types.BMVert,
                         vert_weights: Dict[bmesh.types.BMVert, float],
                         loop_weights: Dict[bmesh.types.BMLoop, float]) -> float:
@@ -215,113 +521,607 @@ def calc_gaussian_curvature(v: bmesh.types.BMVert,
 
 def fair(verts: List[bmesh.types.BMVert],
          order: int,
-         vert_weights: Dict[bmesh.types.BMVert, float],
-         loop_weights: Dict[bmesh.types.BMLoop, float],
-         cancel_event: Optional[threading.Event] = None,
-         status: Optional[types.Property] = None) -> bool:
+         vert_weight: types.VertexWeight,
+         loop_weight: types.LoopWeight,
+         warmup_weights: Optional[Tuple[types.VertexWeight, types.LoopWeight]] = None,
+         warmup_iters: int = RELAX_MAX_ITERATIONS,
+         is_cancelled: Optional[Callable[[], bool]] = None,
+         status: Optional[types.Property] = None) -> Generator[None, None, bool]:
     """
     Displaces given vertices to form a smooth-as-possible mesh patch
 
+    The topology surrounding the vertices is indexed once. If warm-up weights
+    are given, vertices are first pre-faired with positional continuity to
+    seed consistent positions, from which the main weights are calculated;
+    these weights are cached for repeated invocations over the same region.
+    Each Laplace-Beltrami operator is assembled from coordinate triplets and
+    raised to the given order with matrix products.
+
+    This function is a generator that yields after each unit of work, allowing
+    callers to interleave fairing with other tasks; its return value is only
+    available upon completion (e.g., via 'yield from').
+
     Parameters:
         verts (List[bmesh.types.BMVert]):               Vertices to act upon
         order (int):                                    Laplace-Beltrami
                                                         operator order
-        vert_weights (Dict[bmesh.types.BMVert, float]): Vertex weights
-        loop_weights (Dict[bmesh.types.BMLoop, float]): Loop weights
-        cancel_event (Optional[threading.Event]):       Event that can be set
-                                                        to return prematurely
+        vert_weight (types.VertexWeight):               Vertex weight type
+        loop_weight (types.LoopWeight):                 Loop weight type
+        warmup_weights (Optional[Tuple[types.VertexWeight, types.LoopWeight]]):
+                                                        Weight types with
+                                                        which to pre-fair
+        warmup_iters (int):                             Maximum number of
+                                                        relaxation iterations
+                                                        to pre-fair without a
+                                                        sparse solver
+        is_cancelled (Optional[Callable[[], bool]]):    Predicate that can
+                                                        become true to return
+                                                        prematurely
         status (Optional[types.Property]):              Status message
 
     Returns:
         bool: True if fairing succeeded; False otherwise
     """
-    # Setup the linear system.
-    interior_verts = (v for v in verts if not v.is_boundary and not v.is_wire)
+    numpy = importlib.import_module('numpy')
+    if is_cancelled is None:
+        is_cancelled = lambda: False
+    if status is None:
+        status = types.Property()
+
+    # Index interior vertices ahead of the remaining vertices whose Laplacian
+    # contributes to the linear system, yielding after each batch of vertices.
+    status.set('Indexing vertices')
+    yield
+    interior_verts = list()
+    for i in range(0, len(verts), INDEX_BATCH_SIZE):
+        interior_verts.extend(v for v in verts[i:i + INDEX_BATCH_SIZE]
+                              if not v.is_boundary and not v.is_wire)
+        yield
+        if is_cancelled():
+            return False
+    if len(interior_verts) == 0:
+        return False
     vert_col_map = {v: col for col, v in enumerate(interior_verts)}
-    A = dict()
-    b = [[0 for i in range(3)] for j in range(len(vert_col_map))]
-    for v, col in vert_col_map.items():
-        if cancel_event is None or not cancel_event.is_set():
-            if status is not None:
-                status.set('Setting up linear system ({:>3}%)'.format(
-                    int((col + 1) / len(vert_col_map) * 100)))
-            setup_fairing(v, col, A, b, 1, order, vert_col_map, vert_weights, loop_weights)
-
-    # Solve the linear system.
-    if cancel_event is None or not cancel_event.is_set():
-        if status is not None:
-            status.set('Solving linear system')
-        x = linalg.solver.solve(A, b)
+    expanded_verts = yield from expand_verts(
+        interior_verts, order - 1, is_cancelled)
+    if expanded_verts is None:
+        return False
+    for v in sorted(expanded_verts, key = lambda v: v.index):
+        vert_col_map.setdefault(v, len(vert_col_map))
+    stencil = list(vert_col_map)
+
+    # Describe each loop of these vertices by vertex indices, adding vertices
+    # beyond them; loops of interior vertices come first.
+    status.set('Indexing loops')
+    index = lambda v: vert_col_map.setdefault(v, len(vert_col_map))
+    a, b, c, d = [], [], [], []
+    for i in range(0, len(stencil), INDEX_BATCH_SIZE):
+        loops = [l for v in stencil[i:i + INDEX_BATCH_SIZE] for l in v.link_loops]
+        a.append(numpy.fromiter(
+            (vert_col_map[l.vert] for l in loops), numpy.intp, len(loops)))
+        b.append(numpy.fromiter(
+            (index(l.link_loop_next.vert) for l in loops), numpy.intp, len(loops)))
+        c.append(numpy.fromiter(
+            (index(l.link_loop_prev.vert) for l in loops), numpy.intp, len(loops)))
+        d.append(numpy.fromiter((
+            -1 if l.edge.is_boundary else
+            index(l.link_loop_radial_next.link_loop_next.link_loop_next.vert)
+            for l in loops), numpy.intp, len(loops)))
+        yield
+        if is_cancelled():
+            return False
+    a, b, c, d = (numpy.concatenate(array) for array in (a, b, c, d))
+
+    # Gather valences and coordinates.
+    valence = numpy.fromiter(
+        (len(v.link_edges) for v in stencil), numpy.float64, len(stencil))
+    vert_cols = list(vert_col_map)
+    co = numpy.empty((len(vert_cols), 3))
+    for i in range(0, len(vert_cols), INDEX_BATCH_SIZE):
+        batch = vert_cols[i:i + INDEX_BATCH_SIZE]
+        co[i:i + len(batch)] = get_coords(batch, len(batch))
+        yield
+        if is_cancelled():
+            return False
+    n_interior = len(interior_verts)
+
+    # Fair interior vertices.
+    x = yield from fair_loops(
+        co, n_interior, a, b, c, d, valence, order, vert_weight, loop_weight,
+        warmup_weights, warmup_iters, is_cancelled, status)
 
     # Apply results.
-    if cancel_event is None or not cancel_event.is_set():
-        if x is not None:
-            if status is not None:
-                status.set('Applying results')
-            for v, col in vert_col_map.items():
-                v.co = x[col]
-            return True
+    if x is None or is_cancelled():
+        return False
+    status.set('Applying results')
+    set_coords(interior_verts, x)
+    return True
+
+
+def fair_polygons(co, face_verts, face_sizes, verts, order: int,
+                  vert_weight: types.VertexWeight,
+                  loop_weight: types.LoopWeight,
+                  warmup_weights: Optional[Tuple[types.VertexWeight, types.LoopWeight]] = None,
+                  warmup_iters: int = RELAX_MAX_ITERATIONS,
+                  is_cancelled: Optional[Callable[[], bool]] = None,
+                  status: Optional[types.Property] = None) -> Generator[None, None, bool]:
+    """
+    Displaces given vertices of a mesh described by arrays to form a
+    smooth-as-possible mesh patch, without requiring a BMesh
 
-    return False
+    This function is a generator that yields after each unit of work, allowing
+    callers to interleave fairing with other tasks; its return value is only
+    available upon completion (e.g., via 'yield from').
 
+    Parameters:
+        co (numpy.ndarray):                             Coordinates of every
+                                                        vertex of the mesh,
+                                                        updated in place
+        face_verts (numpy.ndarray):                     Vertex indices of the
+                                                        loops of each face of
+                                                        the mesh
+        face_sizes (numpy.ndarray):                     Number of loops of
+                                                        each face
+        verts (numpy.ndarray):                          Indices of vertices to
+                                                        act upon, in ascending
+                                                        order
+        order (int):                                    Laplace-Beltrami
+                                                        operator order
+        vert_weight (types.VertexWeight):               Vertex weight type
+        loop_weight (types.LoopWeight):                 Loop weight type
+        warmup_weights (Optional[Tuple[types.VertexWeight, types.LoopWeight]]):
+                                                        Weight types with
+                                                        which to pre-fair
+        warmup_iters (int):                             Maximum number of
+                                                        relaxation iterations
+                                                        to pre-fair without a
+                                                        sparse solver
+        is_cancelled (Optional[Callable[[], bool]]):    Predicate that can
+                                                        become true to return
+                                                        prematurely
+        status (Optional[types.Property]):              Status message
 
-def setup_fairing(v: bmesh.types.BMVert,
-                  i: int,
-                  A: Dict[Tuple[int], float],
-                  b: List[List[float]],
-                  multiplier: float,
-                  depth: int,
-                  vert_col_map: Dict[bmesh.types.BMVert, int],
-                  vert_weights: Dict[bmesh.types.BMVert, float],
-                  loop_weights: Dict[bmesh.types.BMLoop, float]):
+    Returns:
+        bool: True if fairing succeeded; False otherwise
     """
-    Recursive helper function to build a linear system that represents the
-    discretized fairing problem
+    numpy = importlib.import_module('numpy')
+    if is_cancelled is None:
+        is_cancelled = lambda: False
+    if status is None:
+        status = types.Property()
+
+    # Index the vertices and loops of the region.
+    status.set('Indexing vertices')
+    yield
+    vert_index, n_interior, a, b, c, d, valence = index_polygons(
+        face_verts, face_sizes, verts, order - 1, len(co))
+    if n_interior == 0 or is_cancelled():
+        return False
+
+    # Fair interior vertices.
+    x = yield from fair_loops(
+        co[vert_index].astype(numpy.float64), n_interior, a, b, c, d, valence,
+        order, vert_weight, loop_weight, warmup_weights, warmup_iters,
+        is_cancelled, status)
+
+    # Apply results.
+    if x is None or is_cancelled():
+        return False
+    status.set('Applying results')
+    co[vert_index[:n_interior]] = x
+    return True
 
-    Implementation details are based on CGAL source code available on GitHub:
 
-        cgal/Polygon_mesh_processing/include/CGAL/Polygon_mesh_processing/internal/fair_impl.h
+def triangulate_polygons(co, tris, tri_polygons, loop_starts, loop_totals,
+                         loop_verts, polygons):
+    """
+    Replaces given polygons of a mesh with their triangles, splitting quads
+    along the diagonal that Blender's beauty triangulation would choose rather
+    than the fixed diagonal of the mesh tessellation
+
+    Following the beauty criterion, each quad is projected onto its plane and
+    the split whose triangles have the greater sum of area to perimeter
+    ratios is chosen, unless it would produce flipped or degenerate triangles.
 
     Parameters:
-        v (bmesh.types.BMVert):                         Vertex
-        i (int):                                        Row index of A
-        A (Dict[Tuple[int], float]):                    Coefficient matrix A
-        b (List[List[float]]):                          Right hand side of the
-                                                        linear system
-        multiplier (float):                             Recursive multiplier
-        depth (int):                                    Recursion depth
-        vert_col_map (Dict[bmesh.types.BMVert, int]):   Maps each vertex to a
-                                                        column index j of A
-        vert_weights (Dict[bmesh.types.BMVert, float]): Vertex weights
-        loop_weights (Dict[bmesh.types.BMLoop, float]): Loop weights
+        co (numpy.ndarray):           Coordinates of every vertex of the mesh
+        tris (numpy.ndarray):         Vertex indices of each triangle of the
+                                      mesh tessellation
+        tri_polygons (numpy.ndarray): Polygon index of each triangle
+        loop_starts (numpy.ndarray):  First loop index of each polygon
+        loop_totals (numpy.ndarray):  Number of loops of each polygon
+        loop_verts (numpy.ndarray):   Vertex index of each loop
+        polygons (numpy.ndarray):     Flag of each polygon to triangulate
+
+    Returns:
+        Tuple[numpy.ndarray]: Vertex indices of the loops of each resulting
+                              face, followed by the number of loops of each
+    """
+    numpy = importlib.import_module('numpy')
+    is_quad = polygons & (loop_totals == 4)
+    quads = loop_verts[loop_starts[is_quad][:, None] + numpy.arange(4)]
+    p = co[quads].astype(numpy.float64)
+
+    # Project quads onto the plane of their triangles split along 0-2.
+    normal = (numpy.cross(p[:, 1] - p[:, 0], p[:, 2] - p[:, 0]) +
+              numpy.cross(p[:, 2] - p[:, 0], p[:, 3] - p[:, 0]))
+    normal_len = numpy.linalg.norm(normal, axis = 1)
+    normal /= numpy.where(normal_len == 0, 1, normal_len)[:, None]
+    p -= numpy.einsum('ijk,ik->ij', p, normal)[:, :, None] * normal[:, None]
+
+    # Calculate signed doubled areas of the triangles of either split.
+    def calc_area(i, j, k):
+        return numpy.einsum('ij,ij->i', numpy.cross(
+            p[:, j] - p[:, i], p[:, k] - p[:, i]), normal)
+    area_012 = calc_area(0, 1, 2)
+    area_023 = calc_area(0, 2, 3)
+    area_123 = calc_area(1, 2, 3)
+    area_130 = calc_area(1, 3, 0)
+    length = lambda i, j: numpy.linalg.norm(p[:, j] - p[:, i], axis = 1)
+    len_01, len_12, len_23, len_30 = length(0, 1), length(1, 2), length(2, 3), length(3, 0)
+    len_02, len_13 = length(0, 2), length(1, 3)
+
+    # Split along 1-3 only if it is usable and better than a usable 0-2 split.
+    eps = numpy.finfo(numpy.float32).eps
+    is_usable_02 = ((area_012 >= 0) == (area_023 >= 0)) & (
+        numpy.minimum(numpy.abs(area_012), numpy.abs(area_023)) > eps)
+    is_usable_13 = ((area_123 >= 0) == (area_130 >= 0)) & (
+        numpy.minimum(numpy.abs(area_123), numpy.abs(area_130)) > eps)
+    with numpy.errstate(divide = 'ignore', invalid = 'ignore'):
+        fac_02 = (numpy.abs(area_012) / (len_01 + len_12 + len_02) +
+                  numpy.abs(area_023) / (len_23 + len_30 + len_02))
+        fac_13 = (numpy.abs(area_123) / (len_12 + len_23 + len_13) +
+                  numpy.abs(area_130) / (len_30 + len_01 + len_13))
+    split_13 = is_usable_13 & (~is_usable_02 | (fac_13 > fac_02))
+
+    # Keep the loops of polygons left intact, followed by the tessellation of
+    # other polygons and the split of quads, preserving their winding.
+    split = numpy.where(split_13[:, None, None],
+                        numpy.array([[1, 2, 3], [1, 3, 0]]),
+                        numpy.array([[0, 1, 2], [0, 2, 3]]))
+    quad_tris = numpy.take_along_axis(quads, split.reshape(-1, 6), axis = 1)
+    poly_tris = tris[(polygons & ~is_quad)[tri_polygons]]
+    face_verts = numpy.concatenate((
+        loop_verts[~numpy.repeat(polygons, loop_totals)],
+        poly_tris.ravel(), quad_tris.ravel())).astype(numpy.intp)
+    face_sizes = numpy.concatenate((
+        loop_totals[~polygons], numpy.full(
+            len(poly_tris) + 2 * len(quad_tris), 3))).astype(numpy.intp)
+    return face_verts, face_sizes
+
+
+def get_involved_polygons(loop_totals, loop_verts, loop_edges, verts,
+                          dist: int, vert_count: int):
     """
-    if depth == 0:
+    Flags polygons of a mesh described by arrays that are linked to given
+    vertices, expanded by a specified topological distance across edges, in
+    the manner of get_involved_faces()
 
-        # Set the coefficient of an internal vertex.
-        if v in vert_col_map:
-            j = vert_col_map[v]
-            if (i, j) not in A:
-                A[i, j] = 0
-            A[i, j] -= multiplier
+    Parameters:
+        loop_totals (numpy.ndarray): Number of loops of each polygon
+        loop_verts (numpy.ndarray):  Vertex index of each loop
+        loop_edges (numpy.ndarray):  Edge index of each loop
+        verts (numpy.ndarray):       Indices of vertices to evaluate
+        dist (int):                  Topological distance
+        vert_count (int):            Number of vertices of the mesh
 
-        # Set the value of a boundary vertex.
-        else:
-            b[i][0] += multiplier * v.co.x
-            b[i][1] += multiplier * v.co.y
-            b[i][2] += multiplier * v.co.z
+    Returns:
+        numpy.ndarray: Flag of each involved polygon
+    """
+    numpy = importlib.import_module('numpy')
+    loop_polygons = numpy.repeat(numpy.arange(len(loop_totals)), loop_totals)
+    is_given = numpy.zeros(vert_count, dtype = numpy.bool_)
+    is_given[verts] = True
+    involved = numpy.bincount(
+        loop_polygons, is_given[loop_verts], len(loop_totals)) > 0
+    for i in range(dist):
+        is_reached = numpy.zeros(loop_edges.max(initial = -1) + 1, dtype = numpy.bool_)
+        is_reached[loop_edges[involved[loop_polygons]]] = True
+        involved = numpy.bincount(
+            loop_polygons, is_reached[loop_edges], len(loop_totals)) > 0
+    return involved
+
+
+def index_polygons(face_verts, face_sizes, verts, dist: int, vert_count: int) -> Tuple:
+    """
+    Describes the loops of given vertices of a mesh described by arrays, and
+    of the vertices within a specified topological distance of them, in the
+    layout accepted by fair_loops()
+
+    Parameters:
+        face_verts (numpy.ndarray): Vertex indices of the loops of each face
+        face_sizes (numpy.ndarray): Number of loops of each face
+        verts (numpy.ndarray):      Indices of vertices to act upon, in
+                                    ascending order
+        dist (int):                 Topological distance of the stencil beyond
+                                    the interior vertices
+        vert_count (int):           Number of vertices of the mesh
+
+    Returns:
+        Tuple: Mesh vertex index of each column, number of interior vertices,
+               loop vertex columns (a, b, c, d) and valence of each stencil
+               vertex
+    """
+    numpy = importlib.import_module('numpy')
+    face_verts = numpy.asarray(face_verts, dtype = numpy.intp)
+    face_sizes = numpy.asarray(face_sizes, dtype = numpy.intp)
+
+    # Describe each loop by its vertex and those of the next, previous and
+    # second next loops, and identify its edge regardless of direction.
+    loop_sizes = numpy.repeat(face_sizes, face_sizes)
+    loop_starts = numpy.repeat(numpy.cumsum(face_sizes) - face_sizes, face_sizes)
+    loop_offsets = numpy.arange(len(face_verts)) - loop_starts
+    shift = lambda k: face_verts[loop_starts + (loop_offsets + k) % loop_sizes]
+    loop_a = face_verts
+    loop_b = shift(1)
+    loop_c = shift(-1)
+    loop_e = shift(2)
+    edge_key = (numpy.minimum(loop_a, loop_b) * vert_count +
+                numpy.maximum(loop_a, loop_b))
+
+    # Pair each loop with the next loop sharing its edge, cycling through
+    # loops of non-manifold edges; the vertex following the edge in the
+    # radial face is the second next vertex of the radial loop.
+    loop_order = numpy.argsort(edge_key, kind = 'stable')
+    sorted_key = edge_key[loop_order]
+    is_start = numpy.ones(len(sorted_key), dtype = numpy.bool_)
+    is_start[1:] = sorted_key[1:] != sorted_key[:-1]
+    starts = numpy.flatnonzero(is_start)
+    sizes = numpy.diff(numpy.append(starts, len(sorted_key)))
+    group_start = numpy.repeat(starts, sizes)
+    radial_pos = numpy.arange(len(sorted_key)) + 1
+    is_wrapped = radial_pos == group_start + numpy.repeat(sizes, sizes)
+    radial_pos[is_wrapped] = group_start[is_wrapped]
+    radial = numpy.empty(len(sorted_key), dtype = numpy.intp)
+    radial[loop_order] = loop_order[radial_pos]
+    is_boundary_loop = numpy.empty(len(sorted_key), dtype = numpy.bool_)
+    is_boundary_loop[loop_order] = numpy.repeat(sizes == 1, sizes)
+    loop_d = numpy.where(is_boundary_loop, -1, loop_e[radial])
+
+    # Count the edges of each vertex and flag vertices on boundary edges or
+    # without faces.
+    edges = numpy.stack(numpy.divmod(sorted_key[starts], vert_count))
+    valence = numpy.bincount(edges.ravel(), minlength = vert_count)
+    is_excluded = valence == 0
+    is_excluded[loop_a[is_boundary_loop]] = True
+    is_excluded[loop_b[is_boundary_loop]] = True
+
+    # Expand interior vertices ring by ring to form the stencil.
+    interior = verts[~is_excluded[verts]]
+    in_stencil = numpy.zeros(vert_count, dtype = numpy.bool_)
+    in_stencil[interior] = True
+    frontier = in_stencil.copy()
+    for i in range(dist):
+        reached = numpy.zeros(vert_count, dtype = numpy.bool_)
+        reached[edges[1][frontier[edges[0]]]] = True
+        reached[edges[0][frontier[edges[1]]]] = True
+        frontier = reached & ~in_stencil
+        in_stencil |= frontier
+
+    # Assign columns to interior vertices first, then to remaining stencil
+    # vertices and finally to vertices beyond the stencil.
+    is_stencil_loop = in_stencil[loop_a]
+    loop_b = loop_b[is_stencil_loop]
+    loop_c = loop_c[is_stencil_loop]
+    loop_d = loop_d[is_stencil_loop]
+    in_stencil[interior] = False
+    stencil = numpy.concatenate((interior, numpy.flatnonzero(in_stencil)))
+    is_beyond = numpy.zeros(vert_count, dtype = numpy.bool_)
+    is_beyond[loop_b] = True
+    is_beyond[loop_c] = True
+    is_beyond[loop_d[loop_d >= 0]] = True
+    is_beyond[stencil] = False
+    vert_index = numpy.concatenate((stencil, numpy.flatnonzero(is_beyond)))
+    col = numpy.full(vert_count, -1, dtype = numpy.intp)
+    col[vert_index] = numpy.arange(len(vert_index))
+
+    # Order loops by the column of their vertex.
+    a = col[loop_a[is_stencil_loop]]
+    loop_order = numpy.argsort(a, kind = 'stable')
+    d = loop_d[loop_order]
+    d = numpy.where(d >= 0, col[d], -1)
+    return (vert_index, len(interior), a[loop_order], col[loop_b[loop_order]],
+            col[loop_c[loop_order]], d, valence[stencil].astype(numpy.float64))
+
+
+def fair_loops(co, n_interior: int, a, b, c, d, valence, order: int,
+               vert_weight: types.VertexWeight,
+               loop_weight: types.LoopWeight,
+               warmup_weights: Optional[Tuple[types.VertexWeight, types.LoopWeight]],
+               warmup_iters: int,
+               is_cancelled: Callable[[], bool],
+               status: types.Property) -> Generator:
+    """
+    Solves for the positions of interior vertices of a region described by
+    its loops, pre-fairing them first if warm-up weights are given
+
+    Parameters:
+        co (numpy.ndarray):                             Vertex coordinates,
+                                                        interior vertices first
+        n_interior (int):                               Number of interior
+                                                        vertices
+        a, b, c, d (numpy.ndarray):                     Vertex indices
+                                                        describing each loop,
+                                                        ordered by a
+        valence (numpy.ndarray):                        Number of edges linked
+                                                        to each vertex whose
+                                                        loops are given
+        order (int):                                    Laplace-Beltrami
+                                                        operator order
+        vert_weight (types.VertexWeight):               Vertex weight type
+        loop_weight (types.LoopWeight):                 Loop weight type
+        warmup_weights (Optional[Tuple[types.VertexWeight, types.LoopWeight]]):
+                                                        Weight types with
+                                                        which to pre-fair
+        warmup_iters (int):                             Maximum number of
+                                                        relaxation iterations
+        is_cancelled (Callable[[], bool]):              Predicate that can
+                                                        become true to return
+                                                        prematurely
+        status (types.Property):                        Status message
+
+    Returns:
+        numpy.ndarray: Interior vertex coordinates; None if unsuccessful
+    """
+    numpy = importlib.import_module('numpy')
+
+    # Identify the weights of this region. Pre-fairing replaces interior
+    # positions, leaving weights dependent only on topology and the positions
+    # of the remaining vertices.
+    digest = hashlib.blake2b(digest_size = 16)
+    for array in (a, b, c, d, valence,
+                  co if warmup_weights is None else co[n_interior:]):
+        digest.update(array.tobytes())
+    key = (vert_weight, loop_weight, warmup_weights, warmup_iters,
+           type(linalg.solver), digest.digest())
+
+    # Reuse weights from a previous invocation over the same region, which is
+    # common when fairing is repeated.
+    if key in _weight_cache:
+        _weight_cache.move_to_end(key)
+        vert_weights, loop_weights = _weight_cache[key]
     else:
-        w_ij_sum = 0
-        w_i = vert_weights[v]
 
-        # Recursively compute adjacent vertices.
-        for l in v.link_loops:
-            other = l.link_loop_next.vert
-            w_ij = loop_weights[l]
-            w_ij_sum += w_ij
-            setup_fairing(other, i, A, b, w_i * w_ij * multiplier, depth - 1, vert_col_map, vert_weights, loop_weights)
+        # Pre-fair interior vertices with positional continuity.
+        if warmup_weights is not None:
+            m = numpy.searchsorted(a, n_interior)
+            status.set('[Pre-Fairing] Computing weights')
+            yield
+            vert_weights, loop_weights = calc_weights(
+                *warmup_weights, co, a[:m], b[:m], c[:m], d[:m], valence[:n_interior])
+            if linalg.solver.is_sparse:
+                status.set('[Pre-Fairing] Solving linear system')
+                x = yield from solve_fairing(
+                    co, n_interior, a[:m], b[:m], vert_weights[a[:m]] * loop_weights,
+                    1, is_cancelled)
+            else:
+                x = yield from relax_fairing(
+                    co, n_interior, a[:m], b[:m], loop_weights, warmup_iters,
+                    is_cancelled, status)
+            if x is None or is_cancelled():
+                return None
+            co[:n_interior] = x
+
+        # Calculate weights of the main pass, evicting the least recently used
+        # weights if the cache is full.
+        status.set('[Fairing] Computing weights')
+        yield
+        vert_weights, loop_weights = calc_weights(
+            vert_weight, loop_weight, co, a, b, c, d, valence)
+        _weight_cache[key] = (vert_weights, loop_weights)
+        if len(_weight_cache) > WEIGHT_CACHE_SIZE:
+            _weight_cache.popitem(last = False)
+
+    # Fair interior vertices with the given continuity.
+    status.set('[Fairing] Solving linear system')
+    return (yield from solve_fairing(
+        co, n_interior, a, b, vert_weights[a] * loop_weights, order,
+        is_cancelled))
+
+
+def solve_fairing(co, n_interior: int, rows, cols, weights, order: int,
+                  is_cancelled: Callable[[], bool]) -> Generator:
+    """
+    Solves for the positions of interior vertices that satisfy the discretized
+    fairing problem
+
+    The Laplacian of each vertex is the weighted sum of differences between
+    its neighbors and itself, and interior rows of its power are solved with
+    the terms of known vertices moved to the right hand side.
 
-        # Recursively compute this vertex.
-        setup_fairing(v, i, A, b, -1 * w_i * w_ij_sum * multiplier, depth - 1, vert_col_map, vert_weights, loop_weights)
+    Parameters:
+        co (numpy.ndarray):                Vertex coordinates, interior
+                                           vertices first
+        n_interior (int):                  Number of interior vertices
+        rows (numpy.ndarray):              Vertex index of each loop
+        cols (numpy.ndarray):              Neighbor index of each loop
+        weights (numpy.ndarray):           Product of vertex and loop weights
+                                           of each loop
+        order (int):                       Laplace-Beltrami operator order
+        is_cancelled (Callable[[], bool]): Predicate that can become true to
+                                           return prematurely
+
+    Returns:
+        numpy.ndarray: Interior vertex coordinates; None if unsuccessful
+    """
+    numpy = importlib.import_module('numpy')
+    n = len(co)
+
+    # Assemble and factorize in double precision; raising the operator to
+    # higher orders compounds its conditioning beyond what single precision
+    # can resolve.
+    try:
+        L = linalg.solver.create_matrix(
+            numpy.concatenate((rows, rows)), numpy.concatenate((cols, rows)),
+            numpy.concatenate((weights, -weights)), (n, n))
+        if L is None:
+            return None
+        M = L[:n_interior]
+        for depth in range(1, order):
+            yield
+            if is_cancelled():
+                return None
+            M = M @ L
+        yield
+        if is_cancelled():
+            return None
+        return linalg.solver.solve(
+            -M[:, :n_interior], M[:, n_interior:] @ co[n_interior:])
+    except Exception as e:
+        logging.warn(e)
+        return None
+
+
+def relax_fairing(co, n_interior: int, rows, cols, weights, max_iterations: int,
+                  is_cancelled: Callable[[], bool],
+                  status: types.Property) -> Generator:
+    """
+    Iteratively moves interior vertices toward the weighted average of their
+    neighbors until they settle, converging to the result of positional
+    continuity fairing without solving a linear system
+
+    Parameters:
+        co (numpy.ndarray):                Vertex coordinates, interior
+                                           vertices first
+        n_interior (int):                  Number of interior vertices
+        rows (numpy.ndarray):              Vertex index of each loop, in
+                                           ascending order
+        cols (numpy.ndarray):              Neighbor index of each loop
+        weights (numpy.ndarray):           Loop weight of each loop
+        max_iterations (int):              Maximum number of iterations
+        is_cancelled (Callable[[], bool]): Predicate that can become true to
+                                           return prematurely
+        status (types.Property):           Status message
+
+    Returns:
+        numpy.ndarray: Interior vertex coordinates; None if unsuccessful
+    """
+    numpy = importlib.import_module('numpy')
+    indptr = numpy.zeros(n_interior + 1, dtype = numpy.intp)
+    numpy.cumsum(numpy.bincount(rows, minlength = n_interior), out = indptr[1:])
+    x = co.copy()
+    threshold = RELAX_TOLERANCE * numpy.ptp(x, axis = 0).max()
+    relax = linalg.get_relax()
+    iterations = 0
+    prev_delta = math.inf
+    while iterations < max_iterations:
+        status.set('[Pre-Fairing] Relaxing vertices ({} iterations)'.format(iterations))
+        yield
+        if is_cancelled():
+            return None
+        delta = relax(indptr, cols, weights, x, RELAX_BATCH_SIZE)
+        iterations += RELAX_BATCH_SIZE
+
+        # Stop once the remaining error, extrapolated from the rate at which
+        # displacements shrink between batches, is within tolerance.
+        if delta == 0:
+            break
+        if delta < prev_delta < math.inf:
+            rate = (delta / prev_delta) ** (1 / RELAX_BATCH_SIZE)
+            if delta * rate / (1 - rate) <= threshold:
+                break
+        prev_delta = min(delta, prev_delta)
+    return x[:n_interior]
 
 
 def find_edge(v1: bmesh.types.BMVert,
@@ -370,48 +1170,154 @@ def get_closed_neighborhood(v: bmesh.types.BMVert, dist: int) -> Set[bmesh.types
     return visited
 
 
-def expand_faces(faces: Set[bmesh.types.BMFace], dist: int) -> Set[bmesh.types.BMFace]:
+def expand_verts(verts: Iterable[bmesh.types.BMVert], dist: int,
+                 is_cancelled: Optional[Callable[[], bool]] = None) -> Generator:
     """
-    Expands given face set by a specified topological distance
+    Expands given vertex set by a specified topological distance
+
+    This function is a generator that yields after each batch of vertices
+    visited; its return value is only available upon completion (e.g., via
+    'yield from').
 
     Parameters:
-        faces (List[bmesh.types.BMFace]): Faces to evaluate
-        dist (int):                       Topological distance
+        verts (Iterable[bmesh.types.BMVert]):        Vertices to evaluate
+        dist (int):                                  Topological distance
+        is_cancelled (Optional[Callable[[], bool]]): Predicate that can become
+                                                     true to return
+                                                     prematurely
 
     Returns:
-        Set[bmesh.types.BMFace]: Expanded face selection
+        Set[bmesh.types.BMVert]: Expanded vertex selection; None if cancelled
     """
-    if dist <= 0:
-        visited = set(faces)
-    else:
-        visited = set()
-        traversal_queue = collections.deque((f, 0) for f in faces)
-        while len(traversal_queue) > 0:
-            f_curr, dist_curr = traversal_queue.pop()
-            visited.add(f_curr)
-            if dist_curr < dist:
-                dist_next = dist_curr + 1
-                for l in f_curr.loops:
-                    f_next = l.link_loop_radial_next.face
-                    if f_next not in visited:
-                        traversal_queue.appendleft((f_next, dist_next))
+    if is_cancelled is None:
+        is_cancelled = lambda: False
+    visited = set(verts)
+    frontier = list(visited)
+    for i in range(dist):
+        reached = set()
+        for j in range(0, len(frontier), INDEX_BATCH_SIZE):
+            reached.update(e.other_vert(v)
+                           for v in frontier[j:j + INDEX_BATCH_SIZE]
+                           for e in v.link_edges)
+            yield
+            if is_cancelled():
+                return None
+        reached -= visited
+        visited |= reached
+        frontier = list(reached)
     return visited
 
 
-def get_boundary_faces(faces: Set[bmesh.types.BMFace]) -> Set[bmesh.types.BMFace]:
+def get_face_indices(faces: Iterable[bmesh.types.BMFace]):
+    """
+    Gathers indices of given faces into a contiguous array
+
+    Parameters:
+        faces (Iterable[bmesh.types.BMFace]): Faces to evaluate
+
+    Returns:
+        numpy.ndarray: Face indices
+    """
+    numpy = importlib.import_module('numpy')
+    return numpy.fromiter((f.index for f in faces), numpy.intp)
+
+
+def expand_faces(faces: Iterable[bmesh.types.BMFace], dist: int,
+                 face_seq: bmesh.types.BMFaceSeq) -> Set[bmesh.types.BMFace]:
+    """
+    Expands given face set by a specified topological distance, visiting one
+    ring of neighboring faces at a time
+
+    Parameters:
+        faces (Iterable[bmesh.types.BMFace]): Faces to evaluate
+        dist (int):                           Topological distance
+        face_seq (bmesh.types.BMFaceSeq):     Faces of the mesh with valid
+                                              indices and lookup table
+
+    Returns:
+        Set[bmesh.types.BMFace]: Expanded face selection
+    """
+    numpy = importlib.import_module('numpy')
+    visited = numpy.zeros(len(face_seq), dtype = numpy.bool_)
+    frontier = numpy.unique(get_face_indices(faces))
+    visited[frontier] = True
+    for i in range(dist):
+        if len(frontier) == 0:
+            break
+        neighbors = numpy.fromiter(
+            (l.link_loop_radial_next.face.index
+             for f_index in frontier.tolist() for l in face_seq[f_index].loops),
+            numpy.intp)
+        frontier = numpy.unique(neighbors[~visited[neighbors]])
+        visited[frontier] = True
+    return {face_seq[i] for i in numpy.flatnonzero(visited).tolist()}
+
+
+def get_boundary_faces(faces: Iterable[bmesh.types.BMFace],
+                       face_seq: bmesh.types.BMFaceSeq,
+                       candidates: Optional[Iterable[bmesh.types.BMFace]] = None) -> Set[bmesh.types.BMFace]:
     """
     Determines which among the given faces are boundary faces
 
     Parameters:
-        faces (List[bmesh.types.BMFace]): Faces to evaluate
+        faces (Iterable[bmesh.types.BMFace]):                Faces to evaluate
+        face_seq (bmesh.types.BMFaceSeq):                    Faces of the mesh
+                                                             with valid indices
+        candidates (Optional[Iterable[bmesh.types.BMFace]]): Subset of faces
+                                                             that may be
+                                                             boundary faces;
+                                                             all faces if None
 
     Returns:
         Set[bmesh.types.BMFace]: Boundary faces
     """
-    boundary = set()
-    for f_curr in faces:
-        for l in f_curr.loops:
-            f_other = l.link_loop_radial_next.face
-            if f_other is f_curr or f_other not in faces:
-                boundary.add(f_curr)
-    return boundary
+    numpy = importlib.import_module('numpy')
+    faces = list(faces)
+    candidates = faces if candidates is None else list(candidates)
+
+    # Flag faces belonging to the given set.
+    is_member = numpy.zeros(len(face_seq), dtype = numpy.bool_)
+    is_member[get_face_indices(faces)] = True
+
+    # Gather the face across each loop edge of every candidate.
+    loop_counts = numpy.fromiter((len(f.loops) for f in candidates), numpy.intp)
+    owner = numpy.repeat(numpy.arange(len(candidates)), loop_counts)
+    radial = numpy.fromiter(
+        (l.link_loop_radial_next.face.index for f in candidates for l in f.loops),
+        numpy.intp, int(loop_counts.sum()))
+
+    # A candidate is a boundary face if any of its edges is open or borders a
+    # face outside of the given set.
+    is_open = (radial == get_face_indices(candidates)[owner]) | ~is_member[radial]
+    is_boundary = numpy.bincount(owner, is_open, len(candidates)) > 0
+    return {candidates[i] for i in numpy.flatnonzero(is_boundary).tolist()}
+
+
+def get_involved_faces(verts: List[bmesh.types.BMVert], dist: int,
+                       face_seq: bmesh.types.BMFaceSeq) -> Set[bmesh.types.BMFace]:
+    """
+    Gets faces linked to given vertices, expanded by a specified topological
+    distance beyond the boundary of the linked region
+
+    Parameters:
+        verts (List[bmesh.types.BMVert]):  Vertices to evaluate
+        dist (int):                        Topological distance
+        face_seq (bmesh.types.BMFaceSeq):  Faces of the mesh with valid
+                                           indices and lookup table
+
+    Returns:
+        Set[bmesh.types.BMFace]: Involved faces
+    """
+
+    # Count how many of the given vertices each linked face contains.
+    link_vert_counts = collections.Counter(f for v in verts for f in v.link_faces)
+    faces = set(link_vert_counts)
+
+    # A linked face can only neighbor an unlinked face across an edge whose
+    # vertices are both absent from the given vertices, so other faces never
+    # contribute to the expansion and need not be checked.
+    candidates = (f for f, count in link_vert_counts.items()
+                  if count <= len(f.verts) - 2)
+    faces.update(expand_faces(
+        get_boundary_faces(faces, face_seq, candidates), dist, face_seq))
+    return faces
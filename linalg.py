@@ -17,22 +17,43 @@
 
 import importlib
 import logging
-from typing import Dict, List, Tuple 
+from typing import Tuple
 from . import moduleutil
 
 
 class Solver():
     """
     Linear system solver interface
+
+    Attributes:
+        is_sparse (bool): Indicates whether matrices are stored sparsely
     """
+    is_sparse = False
+
+    def create_matrix(self, rows, cols, values, shape: Tuple[int]):
+        """
+        Creates a matrix from coordinate triplets, summing duplicate entries
+
+        Parameters:
+            rows (numpy.ndarray):   Row index of each entry
+            cols (numpy.ndarray):   Column index of each entry
+            values (numpy.ndarray): Value of each entry
+            shape (Tuple[int]):     Matrix dimensions
+
+        Returns:
+            Any: Matrix in the representation of this solver
+
+        Raises: NotImplementedError
+        """
+        raise NotImplementedError
 
-    def solve(self, A: Dict[Tuple[int], float], b: List[List[float]]):
+    def solve(self, A, b):
         """
         Solves the Ax=b linear system of equations
 
         Parameters:
-            A (Dict[Tuple[int], float]): Coefficient matrix A
-            b (List<List<float>>): Right hand side of the linear system
+            A (Any):           Coefficient matrix A created by this solver
+            b (numpy.ndarray): Right hand side of the linear system
 
         Returns:
             numpy.ndarray: Variables matrix (x); None if unsuccessful
@@ -47,13 +68,28 @@ class NullSolver(Solver):
     Linear system solver implemented as a null object
     """
 
-    def solve(self, A: Dict[Tuple[int], float], b: List[List[float]]):
+    def create_matrix(self, rows, cols, values, shape: Tuple[int]):
+        """
+        Creates a matrix from coordinate triplets
+
+        Parameters:
+            rows (numpy.ndarray):   Row index of each entry
+            cols (numpy.ndarray):   Column index of each entry
+            values (numpy.ndarray): Value of each entry
+            shape (Tuple[int]):     Matrix dimensions
+
+        Returns:
+            None: Indication of no-op
+        """
+        return None
+
+    def solve(self, A, b):
         """
         Solves the Ax=b linear system of equations
 
         Parameters:
-            A (Dict[Tuple[int], float]): Coefficient matrix A
-            b (List[List[float]]): Right hand side of the linear system
+            A (Any):           Coefficient matrix A
+            b (numpy.ndarray): Right hand side of the linear system
 
         Returns:
             None: Indication of no-op
@@ -76,27 +112,40 @@ class NumPySolver(Solver):
         super().__init__(*args, **kwargs)
         self.numpy = importlib.import_module('numpy')
 
-    def solve(self, A: Dict[Tuple[int], float], b: List[List[float]]):
+    def create_matrix(self, rows, cols, values, shape: Tuple[int]):
+        """
+        Creates a dense matrix from coordinate triplets, summing duplicate
+        entries
+
+        Parameters:
+            rows (numpy.ndarray):   Row index of each entry
+            cols (numpy.ndarray):   Column index of each entry
+            values (numpy.ndarray): Value of each entry
+            shape (Tuple[int]):     Matrix dimensions
+
+        Returns:
+            numpy.ndarray: Dense matrix
+        """
+        A = self.numpy.zeros(shape, dtype = 'd')
+        self.numpy.add.at(A, (rows, cols), values)
+        return A
+
+    def solve(self, A, b):
         """
         Solves the Ax=b linear system of equations using NumPy library
 
         Parameters:
-            A (Dict[Tuple[int], float]): Coefficient matrix A
-            b (List[List[float]]): Right hand side of the linear system
+            A (numpy.ndarray): Dense coefficient matrix A
+            b (numpy.ndarray): Right hand side of the linear system
 
         Returns:
             numpy.ndarray: Variables matrix (x); None if unsuccessful
         """
         x = None
-        n = len(b)
 
         # Attempt to solve the linear system with NumPy library.
         try:
-            A_numpy = self.numpy.zeros((n, n), dtype = 'd')
-            b = self.numpy.asarray(b, dtype = 'd')
-            for key, val in A.items():
-                A_numpy[key] = val
-            x = self.numpy.linalg.solve(A_numpy, b)
+            x = self.numpy.linalg.solve(A, b)
         except Exception as e:
             logging.warn(e)
 
@@ -110,6 +159,7 @@ class SciPySolver(Solver):
     Attributes:
         scipy (importlib.type.ModuleType): SciPy library
     """
+    is_sparse = True
 
     def __init__(self, *args, **kwargs):
         """
@@ -119,28 +169,40 @@ class SciPySolver(Solver):
         self.scipy = importlib.import_module('scipy')
         importlib.import_module('scipy.sparse.linalg')
 
-    def solve(self, A: Dict[Tuple[int], float], b: List[List[float]]):
+    def create_matrix(self, rows, cols, values, shape: Tuple[int]):
+        """
+        Creates a compressed sparse row matrix from coordinate triplets,
+        summing duplicate entries
+
+        Parameters:
+            rows (numpy.ndarray):   Row index of each entry
+            cols (numpy.ndarray):   Column index of each entry
+            values (numpy.ndarray): Value of each entry
+            shape (Tuple[int]):     Matrix dimensions
+
+        Returns:
+            scipy.sparse.csr_matrix: Sparse matrix
+        """
+        return self.scipy.sparse.csr_matrix(
+            (values, (rows, cols)), shape = shape, dtype = 'd')
+
+    def solve(self, A, b):
         """
         Solves the Ax=b linear system of equations using SciPy library
 
         Parameters:
-            A (Dict[Tuple[int], float]): Coefficient matrix A
-            b (List[List[float]]): Right hand side of the linear system
+            A (scipy.sparse.spmatrix): Sparse coefficient matrix A
+            b (numpy.ndarray):         Right hand side of the linear system
 
         Returns:
             numpy.ndarray: Variables matrix (x); None if unsuccessful
         """
         x = None
-        n = len(b)
 
         # Attempt to solve the linear system with SciPy libary.
         try:
-            A_scipy = self.scipy.sparse.dok_matrix((n, n), dtype = 'd')
-            A_scipy._update(A)
-            A_scipy = A_scipy.tocsc()
-            b = self.scipy.array(b, dtype = 'd')
             factor = self.scipy.sparse.linalg.splu(
-                A_scipy, diag_pivot_thresh = 0.00001)
+                A.tocsc(), diag_pivot_thresh = 0.00001)
             x = factor.solve(b)
         except Exception as e:
             logging.warn(e)
@@ -148,11 +210,110 @@ class SciPySolver(Solver):
         return x
 
 
+def relax_numpy(indptr, indices, weights, x, iterations: int) -> float:
+    """
+    Performs Jacobi iterations of weighted Laplacian smoothing using NumPy
+    library, where each unknown vertex moves to the weighted average of its
+    neighbors; arithmetic is carried out in the precision of x
+
+    Parameters:
+        indptr (numpy.ndarray):  Row pointers of the weights of unknowns,
+                                 which precede known vertices in x
+        indices (numpy.ndarray): Neighbor index of each weight
+        weights (numpy.ndarray): Weight of each neighbor
+        x (numpy.ndarray):       Vertex positions to update in place
+        iterations (int):        Number of iterations
+
+    Returns:
+        float: Greatest displacement during the last iteration
+    """
+    numpy = importlib.import_module('numpy')
+    n = len(indptr) - 1
+    rows = numpy.repeat(numpy.arange(n), numpy.diff(indptr))
+    weight_sums = numpy.bincount(rows, weights, n).astype(x.dtype)
+    weight_sums[weight_sums == 0] = 1
+    x_next = numpy.empty((n, 3), dtype = x.dtype)
+    delta = 0
+    for i in range(iterations):
+        for axis in range(3):
+            x_next[:, axis] = numpy.bincount(rows, weights * x[indices, axis], n)
+        x_next /= weight_sums[:, None]
+        delta = numpy.abs(x_next - x[:n]).max(initial = 0)
+        x[:n] = x_next
+    return float(delta)
+
+
+def create_numba_relax(numba):
+    """
+    Creates a compiled counterpart of relax_numpy() that processes rows in
+    parallel
+
+    Parameters:
+        numba (importlib.type.ModuleType): Numba library
+
+    Returns:
+        Callable: Compiled relaxation kernel
+    """
+    numpy = importlib.import_module('numpy')
+    prange = numba.prange
+
+    @numba.njit(parallel = True, fastmath = True, cache = True)
+    def relax_numba(indptr, indices, weights, x, iterations):
+        n = len(indptr) - 1
+        x_next = x[:n].copy()
+        deltas = numpy.zeros(n, dtype = x.dtype)
+        zero = x.dtype.type(0)
+        for it in range(iterations):
+            for i in prange(n):
+                sx = sy = sz = sw = zero
+                for k in range(indptr[i], indptr[i + 1]):
+                    j = indices[k]
+                    w = weights[k]
+                    sx += w * x[j, 0]
+                    sy += w * x[j, 1]
+                    sz += w * x[j, 2]
+                    sw += w
+                if sw != 0:
+                    x_next[i, 0] = sx / sw
+                    x_next[i, 1] = sy / sw
+                    x_next[i, 2] = sz / sw
+                deltas[i] = max(abs(x_next[i, 0] - x[i, 0]),
+                                abs(x_next[i, 1] - x[i, 1]),
+                                abs(x_next[i, 2] - x[i, 2]))
+            x[:n] = x_next
+        return deltas.max() if n > 0 else 0.0
+
+    return relax_numba
+
+
+def get_relax():
+    """
+    Gets the relaxation kernel, importing Numba library on first use so that
+    registration does not pay for it; compiled kernels are cached on disk
+
+    Returns:
+        Callable: Relaxation kernel with the signature of relax_numpy()
+    """
+    global relax
+    if relax is None:
+        relax = relax_numpy
+        if moduleutil.is_installed('numpy') and moduleutil.is_installed('numba'):
+            try:
+                relax = create_numba_relax(importlib.import_module('numba'))
+                logging.debug('Using Numba relaxation kernel')
+            except Exception as e:
+                logging.warn(e)
+        if relax is relax_numpy:
+            logging.debug('Using NumPy relaxation kernel')
+    return relax
+
+
 def init():
     """
-    Initializes this module's linear algebra solver
+    Initializes this module's linear algebra solver, deferring the choice of
+    relaxation kernel until it is first used
     """
-    global solver
+    global solver, relax
     if not moduleutil.is_installed('numpy'):
         solver = NullSolver()
         logging.debug('Using NullSolver')
@@ -162,5 +323,7 @@ def init():
     else:
         solver = NumPySolver()
         logging.debug('Using NumPySolver')
+    relax = None
 
 solver = NullSolver()
+relax = None
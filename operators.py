@@ -17,12 +17,44 @@
 
 import bmesh
 import bpy
+import importlib
 import logging
+import operator
+from typing import Generator
 from . import geometry
 from . import moduleutil
 from . import types
 from . import ui
 
+# Interval in seconds between timer events driving mesh fairing tasks, and
+# the time budget in milliseconds of each step, leaving time for redraws.
+TIMER_INTERVAL = 0.033
+STEP_BUDGET = 28
+
+# Buffers reused across invocations, keyed by purpose.
+_scratch = dict()
+
+
+def get_scratch(name: str, shape, dtype):
+    """
+    Gets a reusable uninitialized array, reallocating it only if its shape or
+    type differs from a previous request under the same name
+
+    Parameters:
+        name (str):           Purpose of the array
+        shape (Tuple[int]):   Array dimensions
+        dtype (numpy.dtype):  Array element type
+
+    Returns:
+        numpy.ndarray: Uninitialized array
+    """
+    numpy = importlib.import_module('numpy')
+    buffer = _scratch.get(name)
+    if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+        buffer = numpy.empty(shape, dtype = dtype)
+        _scratch[name] = buffer
+    return buffer
+
 
 class MESH_OT_fair_vertices(bpy.types.Operator):
     bl_idname = 'mesh.fair_vertices'
@@ -84,11 +116,21 @@ class MESH_OT_fair_vertices_internal(bpy.types.Operator):
 
     def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
 
+        # Disallow mesh fairing if NumPy is not installed.
+        if not moduleutil.is_installed('numpy'):
+            ui.display_popup(
+                message = 'Mesh fairing requires NumPy.',
+                title = 'Report: Error',
+                icon = 'ERROR')
+            return {'CANCELLED'}
+
         # Enter modal state of operation.
         wm = context.window_manager
         wm.modal_handler_add(self)
         self._modal_handler = self.modal_start
-        self._timer = wm.event_timer_add(0.1, window = context.window)
+        self._timer = wm.event_timer_add(TIMER_INTERVAL, window = context.window)
+        self._status = ''
+        self._last_dots = None
         return {'RUNNING_MODAL'}
 
     def modal(self, context: bpy.types.Context, event: bpy.types.Event):
@@ -97,8 +139,8 @@ class MESH_OT_fair_vertices_internal(bpy.types.Operator):
     def modal_start(self, context: bpy.types.Context, event: bpy.types.Event):
         mesh = context.edit_object.data
 
-        # Perform mesh fairing in a separate, cancellable thread.
-        self._worker = MESH_OT_fair_vertices_internal.WorkerThread(
+        # Perform mesh fairing in a cancellable task driven by timer events.
+        self._worker = MESH_OT_fair_vertices_internal.WorkerTask(
             mesh, types.Continuity[self.continuity], self.triangulate)
         self._worker.start()
 
@@ -106,17 +148,26 @@ class MESH_OT_fair_vertices_internal(bpy.types.Operator):
         return {'RUNNING_MODAL'}
 
     def modal_monitor(self, context: bpy.types.Context, event: bpy.types.Event):
-        if self._worker.is_alive() and not self._worker.is_cancelled():
-
-            # Display the status of mesh fairing.
-            ellipsis = '.' * (int(self._timer.time_duration * 4) % 4)
-            status = self._worker.get_status()
-            context.area.header_text_set(
-                    text = '{}{:<3} ESC: Cancel'.format(status, ellipsis))
 
-            # Cancel the mesh fairing thread.
-            if event.type == 'ESC' and event.value == 'PRESS':
-                self._worker.cancel()
+        # Cancel the mesh fairing task.
+        if event.type == 'ESC' and event.value == 'PRESS':
+            self._worker.cancel()
+
+        # Advance the mesh fairing task by a small increment of work.
+        elif event.type == 'TIMER':
+            self._worker.step(STEP_BUDGET)
+
+        if self._worker.is_alive():
+
+            # Display the status of mesh fairing only if it has changed.
+            dots = int(self._timer.time_duration * 4) % 4
+            status = self._worker.take_status()
+            if status is not None or dots != self._last_dots:
+                if status is not None:
+                    self._status = status
+                context.area.header_text_set(
+                    text = '{}{:<3} ESC: Cancel'.format(self._status, '.' * dots))
+                self._last_dots = dots
         else:
             self._modal_handler = self.modal_finish
 
@@ -127,9 +178,9 @@ class MESH_OT_fair_vertices_internal(bpy.types.Operator):
         context.window_manager.event_timer_remove(self._timer)
         return {'CANCELLED'} if self._worker.is_cancelled() else {'FINISHED'}
 
-    class WorkerThread(types.CancellableThread):
+    class WorkerTask(types.CancellableTask):
         """
-        Inner worker class for performing mesh fairing in a separate thread
+        Inner worker class for performing mesh fairing in small increments
 
         Attributes:
             _mesh (bpy.types.Mesh):         Mesh on which to operate
@@ -142,7 +193,7 @@ class MESH_OT_fair_vertices_internal(bpy.types.Operator):
                      continuity: types.Continuity,
                      triangulate: bool):
             """
-            Initializes this worker thread
+            Initializes this worker task
 
             Parameters:
                 mesh (bpy.types.Mesh):         Mesh on which to operate
@@ -154,68 +205,86 @@ class MESH_OT_fair_vertices_internal(bpy.types.Operator):
             self._continuity = continuity
             self._triangulate = triangulate
 
-        def run(self):
+        def run(self) -> Generator[None, None, None]:
             """
-            Performs mesh fairing
+            Performs mesh fairing, yielding whenever work can be suspended
             """
-            fairing_status = types.Property()
 
             # Initialize BMesh.
             self.set_status('Initializing BMesh')
+            yield
             bm = bmesh.from_edit_mesh(self._mesh)
+            try:
+                yield from self.fair_mesh(bm)
+            except Exception:
+
+                # Push changes already made, such as triangulation, before
+                # propagating the error.
+                bm.normal_update()
+                bmesh.update_edit_mesh(self._mesh)
+                raise
+
+        def fair_mesh(self, bm: bmesh.types.BMesh) -> Generator[None, None, None]:
+            """
+            Performs mesh fairing on the edit mesh, yielding whenever work can
+            be suspended
+
+            Parameters:
+                bm (bmesh.types.BMesh): BMesh of the edit mesh
+            """
+            fairing_status = types.Property()
 
             # Determine which vertices are affected.
+            affected_verts = list()
             if not self.is_cancelled():
                 self.set_status('Determining which vertices are affected')
-                affected_verts = [v for v in bm.verts if v.select]
+                yield
+                affected_verts = list(
+                    filter(operator.attrgetter('select'), bm.verts))
 
             # Triangulate region to produce higher quality results.
+            triangulated_faces = []
             if not self.is_cancelled() and self._triangulate:
                 self.set_status('Triangulating involved faces')
+                yield
 
                 # Determine which faces are involved, accounting for continuity.
-                involved_faces = {f for v in affected_verts for f in v.link_faces}
-                involved_faces.update(
-                    geometry.expand_faces(
-                        geometry.get_boundary_faces(involved_faces),
-                        self._continuity.value - 1))
+                bm.faces.index_update()
+                bm.faces.ensure_lookup_table()
+                involved_faces = geometry.get_involved_faces(
+                    affected_verts, self._continuity.value - 1, bm.faces)
 
                 # Triangulate involved faces.
-                bmesh.ops.triangulate(bm, faces = list(involved_faces))
-
-                # Flush the selection.
-                bm.select_mode = {'VERT'}
-                bm.select_flush_mode()
-
-            # Pre-fair affected vertices for consistent results.
-            if not self.is_cancelled():
-                self.set_status('[Pre-Fairing] {}', fairing_status)
-                if not geometry.fair(
-                    affected_verts, types.Continuity.POS.value,
-                    types.VertexWeight.UNIFORM.create_cache(),
-                    types.LoopWeight.UNIFORM.create_cache(),
-                    self._cancel_event, fairing_status):
-
-                    # Cancel this thread if pre-fairing failed.
-                    logging.warn('Mesh pre-fairing failed')
-                    self.cancel()
-
-            # Fair affected vertices.
+                triangulation = bmesh.ops.triangulate(
+                    bm, faces = list(involved_faces))
+                triangulated_faces = triangulation['faces']
+
+                # Select new edges and faces spanning only selected vertices,
+                # which are the only elements whose selection can be stale.
+                for e in triangulation['edges']:
+                    if all(v.select for v in e.verts):
+                        e.select = True
+                for f in triangulated_faces:
+                    if all(v.select for v in f.verts):
+                        f.select = True
+
+            # Fair affected vertices, pre-fairing them for consistent results.
             if not self.is_cancelled():
-                self.set_status('[Fairing] {}', fairing_status)
-                if not geometry.fair(
+                self.set_status('{}', fairing_status)
+                if not (yield from geometry.fair(
                     affected_verts, self._continuity.value,
-                    types.VertexWeight.VORONOI.create_cache(),
-                    types.LoopWeight.COTAN.create_cache(),
-                    self._cancel_event, fairing_status):
+                    types.VertexWeight.VORONOI, types.LoopWeight.COTAN,
+                    (types.VertexWeight.UNIFORM, types.LoopWeight.UNIFORM),
+                    is_cancelled = self.is_cancelled, status = fairing_status)):
 
-                    # Cancel this thread if fairing failed.
+                    # Cancel this task if fairing failed.
                     logging.warn('Mesh fairing failed')
                     self.cancel()
 
             # Update the mesh.
             self.set_status('Updating the mesh')
-            bm.normal_update()
+            yield
+            geometry.update_normals(affected_verts, triangulated_faces)
             bmesh.update_edit_mesh(self._mesh)
 
 
@@ -289,13 +358,23 @@ class SCULPT_OT_fair_vertices_internal(bpy.types.Operator):
                 icon = 'ERROR')
             return {'CANCELLED'}
 
+        # Disallow mesh fairing if NumPy is not installed.
+        if not moduleutil.is_installed('numpy'):
+            ui.display_popup(
+                message = 'Mesh fairing requires NumPy.',
+                title = 'Report: Error',
+                icon = 'ERROR')
+            return {'CANCELLED'}
+
         bpy.ops.sculpt.push_undo()
 
         # Enter modal state of operation.
         wm = context.window_manager
         wm.modal_handler_add(self)
         self._modal_handler = self.modal_start
-        self._timer = wm.event_timer_add(0.1, window = context.window)
+        self._timer = wm.event_timer_add(TIMER_INTERVAL, window = context.window)
+        self._status = ''
+        self._last_dots = None
         return {'RUNNING_MODAL'}
 
     def modal(self, context: bpy.types.Context, event: bpy.types.Event):
@@ -304,8 +383,8 @@ class SCULPT_OT_fair_vertices_internal(bpy.types.Operator):
     def modal_start(self, context: bpy.types.Context, event: bpy.types.Event):
         sculpt_object = context.sculpt_object
 
-        # Perform mesh fairing in a separate, cancellable thread.
-        self._worker = SCULPT_OT_fair_vertices_internal.WorkerThread(
+        # Perform mesh fairing in a cancellable task driven by timer events.
+        self._worker = SCULPT_OT_fair_vertices_internal.WorkerTask(
             sculpt_object,
             types.Continuity[self.continuity],
             self.invert_mask)
@@ -315,17 +394,26 @@ class SCULPT_OT_fair_vertices_internal(bpy.types.Operator):
         return {'RUNNING_MODAL'}
 
     def modal_monitor(self, context: bpy.types.Context, event: bpy.types.Event):
-        if self._worker.is_alive() and not self._worker.is_cancelled():
-
-            # Display the status of mesh fairing.
-            ellipsis = '.' * (int(self._timer.time_duration * 4) % 4)
-            status = self._worker.get_status()
-            context.area.header_text_set(
-                text = '{}{:<3} ESC: Cancel'.format(status, ellipsis))
 
-            # Cancel the mesh fairing thread.
-            if event.type == 'ESC' and event.value == 'PRESS':
-                self._worker.cancel()
+        # Cancel the mesh fairing task.
+        if event.type == 'ESC' and event.value == 'PRESS':
+            self._worker.cancel()
+
+        # Advance the mesh fairing task by a small increment of work.
+        elif event.type == 'TIMER':
+            self._worker.step(STEP_BUDGET)
+
+        if self._worker.is_alive():
+
+            # Display the status of mesh fairing only if it has changed.
+            dots = int(self._timer.time_duration * 4) % 4
+            status = self._worker.take_status()
+            if status is not None or dots != self._last_dots:
+                if status is not None:
+                    self._status = status
+                context.area.header_text_set(
+                    text = '{}{:<3} ESC: Cancel'.format(self._status, '.' * dots))
+                self._last_dots = dots
         else:
             self._modal_handler = self.modal_finish
 
@@ -336,9 +424,9 @@ class SCULPT_OT_fair_vertices_internal(bpy.types.Operator):
         context.window_manager.event_timer_remove(self._timer)
         return {'CANCELLED'} if self._worker.is_cancelled() else {'FINISHED'}
 
-    class WorkerThread(types.CancellableThread):
+    class WorkerTask(types.CancellableTask):
         """
-        Inner worker class for performing mesh fairing in a separate thread
+        Inner worker class for performing mesh fairing in small increments
 
         Attributes:
             _sculpt_object (bpy.types.Object): Object on which to operate
@@ -351,7 +439,7 @@ class SCULPT_OT_fair_vertices_internal(bpy.types.Operator):
                      continuity: types.Continuity,
                      invert_mask: bool):
             """
-            Initializes this worker thread
+            Initializes this worker task
 
             Parameters:
                 sculpt_object (bpy.types.Object): Object on which to operate
@@ -363,82 +451,137 @@ class SCULPT_OT_fair_vertices_internal(bpy.types.Operator):
             self._continuity = continuity
             self._invert_mask = invert_mask
 
-        def run(self):
+        def run(self) -> Generator[None, None, None]:
             """
-            Performs mesh fairing
+            Performs mesh fairing, yielding whenever work can be suspended
             """
             fairing_status = types.Property()
+            numpy = importlib.import_module('numpy')
+            mesh = self._sculpt_object.data
 
-            # Initialize BMesh.
-            self.set_status('Initializing BMesh')
-            with types.BMeshGuard() as bm:
-                bm.from_mesh(self._sculpt_object.data, use_shape_key = True,
-                             shape_key_index = self._sculpt_object.active_shape_key_index)
-                mask_layer = bm.verts.layers.paint_mask.active
-
-                # Determine which vertices are affected.
-                affected_verts = list()
-                if not self.is_cancelled():
-                    self.set_status('Determining which vertices are affected')
-                    if mask_layer is not None:
-                        affected_verts = [
-                            v for v in bm.verts
-                            if ((self._invert_mask and v[mask_layer] >= 0.5) or
-                                (not self._invert_mask and v[mask_layer] <= 0.5))
-                        ]
-
-                # Cancel this thread if there is no work to be done, which
-                # effectively avoids an undo event for a null operation.
-                if not self.is_cancelled() and len(affected_verts) == 0:
+            # Determine which vertices are affected.
+            affected_index = numpy.empty(0, dtype = numpy.intp)
+            if not self.is_cancelled():
+                self.set_status('Determining which vertices are affected')
+                yield
+                mask = self.get_mask()
+                if mask is not None:
+                    is_affected = get_scratch('selection', mask.shape, numpy.bool_)
+                    if self._invert_mask:
+                        numpy.greater_equal(mask, 0.5, out = is_affected)
+                    else:
+                        numpy.less_equal(mask, 0.5, out = is_affected)
+                    affected_index = numpy.flatnonzero(is_affected)
+
+            # Cancel this task if there is no work to be done, which
+            # effectively avoids an undo event for a null operation.
+            if not self.is_cancelled() and len(affected_index) == 0:
+                self.cancel()
+
+            # Read vertex coordinates along with the polygons and triangle
+            # tessellation of the mesh.
+            if not self.is_cancelled():
+                self.set_status('Reading mesh data')
+                yield
+                shape_key = self.get_shape_key()
+                vertex_data = mesh.vertices if shape_key is None else shape_key.data
+                co = get_scratch('co', (len(mesh.vertices), 3), numpy.float32)
+                vertex_data.foreach_get('co', co.ravel())
+                mesh.calc_loop_triangles()
+                tris = get_scratch(
+                    'tris', (len(mesh.loop_triangles), 3), numpy.int32)
+                mesh.loop_triangles.foreach_get('vertices', tris.ravel())
+                tri_polygons = get_scratch(
+                    'tri_polygons', (len(mesh.loop_triangles),), numpy.int32)
+                mesh.loop_triangles.foreach_get('polygon_index', tri_polygons)
+                loop_starts = get_scratch(
+                    'loop_starts', (len(mesh.polygons),), numpy.int32)
+                mesh.polygons.foreach_get('loop_start', loop_starts)
+                loop_totals = get_scratch(
+                    'loop_totals', (len(mesh.polygons),), numpy.int32)
+                mesh.polygons.foreach_get('loop_total', loop_totals)
+                loop_verts = get_scratch(
+                    'loop_verts', (len(mesh.loops),), numpy.int32)
+                mesh.loops.foreach_get('vertex_index', loop_verts)
+                loop_edges = get_scratch(
+                    'loop_edges', (len(mesh.loops),), numpy.int32)
+                mesh.loops.foreach_get('edge_index', loop_edges)
+
+            # Triangulate involved polygons to produce higher quality results,
+            # leaving faces beyond the reach of the operator intact.
+            if not self.is_cancelled():
+                self.set_status('Triangulating involved faces')
+                yield
+                involved_polygons = geometry.get_involved_polygons(
+                    loop_totals, loop_verts, loop_edges, affected_index,
+                    self._continuity.value - 1, len(co))
+                face_verts, face_sizes = geometry.triangulate_polygons(
+                    co, tris, tri_polygons, loop_starts, loop_totals,
+                    loop_verts, involved_polygons)
+
+            # Fair affected vertices, pre-fairing them for consistent results.
+            if not self.is_cancelled():
+                self.set_status('{}', fairing_status)
+                if not (yield from geometry.fair_polygons(
+                    co, face_verts, face_sizes, affected_index,
+                    self._continuity.value,
+                    types.VertexWeight.VORONOI, types.LoopWeight.COTAN,
+                    (types.VertexWeight.UNIFORM, types.LoopWeight.UNIFORM),
+                    is_cancelled = self.is_cancelled, status = fairing_status)):
+
+                    # Cancel this task if fairing failed.
+                    logging.warn('Mesh fairing failed')
                     self.cancel()
 
-                # Triangulate region to produce higher quality results.
-                if not self.is_cancelled():
-                    self.set_status('Temporarily triangulating involved faces')
-
-                    # Determine which faces are involved, accounting for continuity.
-                    involved_faces = {f for v in affected_verts for f in v.link_faces}
-                    involved_faces.update(
-                        geometry.expand_faces(
-                            geometry.get_boundary_faces(involved_faces),
-                            self._continuity.value - 1))
-
-                    # Triangulate involved faces.
-                    bmesh.ops.triangulate(bm, faces = list(involved_faces))
-
-                # Pre-fair affected vertices for consistent results.
-                if not self.is_cancelled():
-                    self.set_status('[Pre-Fairing] {}', fairing_status)
-                    if not geometry.fair(
-                        affected_verts, types.Continuity.POS.value,
-                        types.VertexWeight.UNIFORM.create_cache(),
-                        types.LoopWeight.UNIFORM.create_cache(),
-                        self._cancel_event, fairing_status):
-
-                        # Cancel this thread if pre-fairing failed.
-                        logging.warn('Mesh pre-fairing failed')
-                        self.cancel()
-
-                # Fair affected vertices.
-                if not self.is_cancelled():
-                    self.set_status('[Fairing] {}', fairing_status)
-                    if not geometry.fair(
-                        affected_verts, self._continuity.value,
-                        types.VertexWeight.VORONOI.create_cache(),
-                        types.LoopWeight.COTAN.create_cache(),
-                        self._cancel_event, fairing_status):
-
-                        # Cancel this thread if fairing failed.
-                        logging.warn('Mesh fairing failed')
-                        self.cancel()
-
-                # Update the mesh.
-                if not self.is_cancelled():
-                    self.set_status('Updating the mesh')
-                    vertices = self._sculpt_object.data.vertices
-                    for v in affected_verts:
-                        vertices[v.index].co = v.co
-                    self._sculpt_object.data.update()
+            # Update the mesh, writing coordinates back to where they were
+            # read from; the reference shape key mirrors the mesh vertices.
+            if not self.is_cancelled():
+                self.set_status('Updating the mesh')
+                yield
+                vertex_data.foreach_set('co', co.ravel())
+                if (shape_key is not None and
+                    shape_key == mesh.shape_keys.reference_key):
+                    mesh.vertices.foreach_set('co', co.ravel())
+                mesh.update()
+
+        def get_shape_key(self):
+            """
+            Gets the shape key being sculpted
+
+            Returns:
+                bpy.types.ShapeKey: Active shape key; None if the mesh has none
+            """
+            mesh = self._sculpt_object.data
+            if mesh.shape_keys is None or len(mesh.shape_keys.key_blocks) == 0:
+                return None
+            return mesh.shape_keys.key_blocks[
+                self._sculpt_object.active_shape_key_index]
+
+        def get_mask(self):
+            """
+            Reads the sculpt mask of the mesh into a contiguous array
+
+            Returns:
+                numpy.ndarray: Mask value of each vertex; None if unmasked
+            """
+            numpy = importlib.import_module('numpy')
+            mesh = self._sculpt_object.data
+            mask = get_scratch('mask', (len(mesh.vertices),), numpy.float32)
+
+            # Prior to Blender 4.0, the mask is stored in a dedicated layer.
+            if hasattr(mesh, 'vertex_paint_masks'):
+                if len(mesh.vertex_paint_masks) == 0:
+                    return None
+                mesh.vertex_paint_masks[0].data.foreach_get('value', mask)
+
+            # Otherwise, the mask is stored as a generic attribute.
+            else:
+                attribute = mesh.attributes.get('.sculpt_mask')
+                if attribute is None:
+                    return None
+                attribute.data.foreach_get('value', mask)
+
+            return mask
 
 
 class SCULPT_OT_push_undo(bpy.types.Operator):
@@ -19,8 +19,8 @@ import bmesh
 import bpy
 import enum
 import logging
-import threading
-from typing import Any, Callable, Set
+import time
+from typing import Any, Callable, Generator, Optional, Set
 import weakref
 from . import geometry
 
@@ -95,68 +95,6 @@ class Cache(dict):
         return self[key]
 
 
-class CancellableThread(threading.Thread):
-    """
-    Cancellable worker thread
-
-    Attributes:
-        _cancel_event (threading.Event): Threading event to cancel execution
-        _status_fmt (str):               Status message format string
-        _status_args (Tuple[Any]):       Status message arguments
-    """
-
-    def __init__(self, *args, **kwargs):
-        """
-        Initializes this thread
-        """
-        super().__init__(*args, **kwargs)
-        self.daemon = True
-        self._cancel_event = threading.Event()
-        self._status_fmt = ''
-        self._status_args = ()
-
-    def cancel(self):
-        """
-        Cancels this thread only if it is still alive
-        """
-        if self.is_alive():
-            self._cancel_event.set()
-
-    def is_cancelled(self):
-        """
-        Getter for the cancellation state of this thread
-
-        Returns:
-            bool: True if thread not cancelled; False otherwise
-        """
-        return self._cancel_event.is_set()
-
-    def get_status(self) -> str:
-        """
-        Getter for a message indicating the status of this thread
-
-        Returns:
-            str: Status message
-        """
-        status = ''
-        try:
-            status = self._status_fmt.format(*self._status_args)
-        except:
-            logging.warn('Failed to format status message')
-        return status
-
-    def set_status(self, fmt: str, *args):
-        """
-        Setter for a message indicating the status of this thread
-
-        Parameters:
-            fmt (str):         Status message format string
-            args (Tuple[Any]): Status message arguments
-        """
-        self._status_fmt = fmt
-        self._status_args = args
-
-
 class Observable():
     """
     Base class for objects that can inform observers of changes
@@ -226,6 +164,164 @@ class Observer():
         raise NotImplementedError
 
 
+class CancellableTask(Observer):
+    """
+    Cancellable task that is performed cooperatively in small increments
+
+    Subclasses implement run() as a generator that yields whenever work can be
+    suspended; the owner of the task advances it by calling step() until it is
+    no longer alive.
+
+    The status message is formatted whenever it is set or any observable
+    argument of it changes, which this task observes, so that the owner only
+    needs to publish it.
+
+    Attributes:
+        _cancelled (bool):         Flag indicating cancellation
+        _routine (Generator):      Generator performing the work of this task
+        _status_fmt (str):         Status message format string
+        _status_args (Tuple[Any]): Status message arguments
+        _status (str):             Formatted status message
+        _status_changed (bool):    Flag indicating the status message changed
+                                   since it was last taken
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes this task
+        """
+        self._cancelled = False
+        self._routine = None
+        self._status_fmt = ''
+        self._status_args = ()
+        self._status = ''
+        self._status_changed = False
+
+    def run(self) -> Generator[None, None, None]:
+        """
+        Abstract method to perform the work of this task
+
+        Raises: NotImplementedError
+        """
+        raise NotImplementedError
+
+    def start(self):
+        """
+        Starts this task
+        """
+        self._routine = self.run()
+
+    def step(self, budget_ms: float) -> bool:
+        """
+        Advances this task until it finishes or the time budget expires
+
+        Parameters:
+            budget_ms (float): Time budget in milliseconds
+
+        Returns:
+            bool: True if task is still alive; False otherwise
+        """
+        deadline = time.perf_counter() + budget_ms / 1000
+        while self.is_alive():
+            try:
+                next(self._routine)
+            except StopIteration:
+                self._routine = None
+            except Exception as e:
+
+                # Cancel this task if it failed, keeping the error from its
+                # owner so that the owner can still finish cleanly.
+                logging.exception(e)
+                self._cancelled = True
+                self._routine = None
+            if time.perf_counter() >= deadline:
+                break
+        return self.is_alive()
+
+    def is_alive(self) -> bool:
+        """
+        Determines whether this task has been started but not yet finished
+
+        Returns:
+            bool: True if task is alive; False otherwise
+        """
+        return self._routine is not None
+
+    def cancel(self):
+        """
+        Cancels this task only if it is still alive
+        """
+        if self.is_alive():
+            self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        """
+        Getter for the cancellation state of this task
+
+        Returns:
+            bool: True if task cancelled; False otherwise
+        """
+        return self._cancelled
+
+    def get_status(self) -> str:
+        """
+        Getter for a message indicating the status of this task
+
+        Returns:
+            str: Status message
+        """
+        return self._status
+
+    def take_status(self) -> Optional[str]:
+        """
+        Takes the message indicating the status of this task only if it has
+        changed since it was last taken
+
+        Returns:
+            Optional[str]: Status message; None if unchanged
+        """
+        if not self._status_changed:
+            return None
+        self._status_changed = False
+        return self._status
+
+    def set_status(self, fmt: str, *args):
+        """
+        Setter for a message indicating the status of this task, which is
+        kept up to date with any observable arguments
+
+        Parameters:
+            fmt (str):         Status message format string
+            args (Tuple[Any]): Status message arguments
+        """
+        for arg in self._status_args:
+            if isinstance(arg, Observable):
+                arg.unsubscribe(self)
+        self._status_fmt = fmt
+        self._status_args = args
+        for arg in self._status_args:
+            if isinstance(arg, Observable):
+                arg.subscribe(self)
+        self.update(None)
+
+    def update(self, observable, *args, **kwargs):
+        """
+        Formats the status message of this task upon a change in its
+        arguments
+
+        Parameters:
+            observable (types.Observable): Argument that changed
+        """
+        status = ''
+        try:
+            status = self._status_fmt.format(*self._status_args)
+        except:
+            logging.warn('Failed to format status message')
+        if status != self._status:
+            self._status = status
+            self._status_changed = True
+
+
 class Property(Observable):
     """
     Generic property that can be observed for changes in value